@@ -1,9 +1,22 @@
 import os
-import simplejson
-from typing import Dict
+import sys
+import json
+import multiprocessing as mp
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
 import re
+from functools import cached_property, lru_cache
+from bisect import bisect_right
+from itertools import accumulate
 from antlr4.CommonTokenStream import CommonTokenStream
 from antlr4.InputStream import InputStream as ANTLRInputStream
+from antlr4.Token import CommonToken
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .parser.SolidityLexer import SolidityLexer
 from .parser.SolidityParser import SolidityParser
@@ -14,6 +27,28 @@ from .ast_node_types import SourceUnit
 from .tokens import build_token_list
 from .utils import string_from_snake_to_camel_case
 
+# get_antlr_parsing results keyed by (path, content hash), least recently used first
+_PARSE_CACHE_SIZE = 256
+_parse_cache: "OrderedDict[Tuple[str, int], List[Dict]]" = OrderedDict()
+
+# Function header patterns for the regex-based find_*_functions helpers.
+# The Rust, Move and Cairo patterns start at the mandatory fn/fun keyword so
+# re can jump between literal occurrences, and capture the name in group 1.
+# Any visibility/modifiers in front of the keyword are recovered afterwards
+# with the matching *_PREFIX_RE, see _header_start.
+_RUST_FN_RE = re.compile(r"fn\s+(\w+)(?:<[^>]*>)?\s*\([^{]*\)(?:\s*->\s*[^{]*)?\s*\{")
+_RUST_PREFIX_RE = re.compile(r"(?:pub(?:\s*\([^)]*\))?\s+)?\Z")
+_RUST_PREFIX_ENDS = ("pub", ")")
+_MOVE_FN_RE = re.compile(r"fun\s+(?:<[^>]+>\s*)?(\w+)\s*(?:<[^>]+>)?\s*\([^)]*\)(?:\s*:\s*[^{]+)?(?:\s+acquires\s+[^{]+)?\s*(?:\{|;)")
+_MOVE_PREFIX_RE = re.compile(r"(?:public\s+)?(?:entry\s+)?(?:native\s+)?(?:inline\s+)?\Z")
+_MOVE_PREFIX_ENDS = ("public", "entry", "native", "inline")
+_GO_FUNC_RE = re.compile(r"func\s+.*\{")
+# 更新后的正则表达式，使返回类型部分可选
+_PYTHON_DEF_RE = re.compile(r"def\s+(\w+)\s*\((.*?)\)(?:\s*->\s*(\w+))?\s*:")
+_CAIRO_FN_RE = _RUST_FN_RE
+_CAIRO_PREFIX_RE = _RUST_PREFIX_RE
+_CAIRO_PREFIX_ENDS = _RUST_PREFIX_ENDS
+
 
 class ParserError(Exception):
     """
@@ -32,6 +67,101 @@ class ParserError(Exception):
         self.errors = errors
 
 
+class _LazyTokens:
+    """
+    The token list of a parsed source, built with build_token_list on first access.
+    """
+
+    def __init__(self, token_stream: CommonTokenStream, options: SGPVisitorOptions) -> None:
+        token_stream.fill()
+        # keep the tokens (minus EOF) but not the stream, lexer or input stream,
+        # which every token still references through its source
+        self._raw_tokens = token_stream.tokens[:-1]
+        for token in self._raw_tokens:
+            token.text = token.text
+            token.source = CommonToken.EMPTY_SOURCE
+        self._options = options
+
+    @cached_property
+    def _tokens(self) -> List[Dict[str, Any]]:
+        return build_token_list(self._raw_tokens, self._options)
+
+    def __iter__(self):
+        return iter(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __getitem__(self, index):
+        return self._tokens[index]
+
+
+@lru_cache(maxsize=4096)
+def _camel(name: str) -> str:
+    """
+    Cached string_from_snake_to_camel_case; AST attribute names repeat on every node.
+    """
+    return string_from_snake_to_camel_case(name)
+
+
+def _ast_node_to_dict(obj) -> Dict:
+    """
+    JSON `default` hook: serialize an AST node as its attributes in camelCase.
+    """
+    if isinstance(obj, _LazyTokens):
+        return list(obj)
+    return {_camel(k): v for k, v in obj.__dict__.items()}
+
+
+class _CamelCaseEncoder(json.JSONEncoder):
+    """
+    Standard library JSON encoder that writes AST nodes as their attributes in camelCase.
+    """
+
+    def default(self, obj):
+        return _ast_node_to_dict(obj)
+
+
+def _dump_ast_json(source_unit: SourceUnit, path: str) -> None:
+    """
+    Write an AST to path as JSON, using orjson when it is installed.
+
+    orjson refuses integers wider than 64 bits and nesting deeper than 254
+    levels; such ASTs are encoded with _CamelCaseEncoder's C encoder, which
+    goes about as deep as the simplejson dump it replaced. Without orjson the
+    AST is streamed to the file chunk by chunk, falling back to the C encoder
+    when the pure-Python streaming encoder runs out of recursion depth.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                source_unit,
+                default=_ast_node_to_dict,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            with open(path, "wb") as f:
+                f.write(data)
+            return
+
+    # match orjson's output: compact separators, UTF-8 instead of \u escapes
+    encoder = _CamelCaseEncoder(separators=(",", ":"), ensure_ascii=False)
+    if orjson is None:
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(encoder.iterencode(source_unit))
+            return
+        except RecursionError:
+            pass
+
+    # encode() takes the C encoder, which nests about twice as deep as the
+    # pure-Python iterencode() generators
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(encoder.encode(source_unit))
+
+
 def parse(
     input_string: str,
     options: SGPVisitorOptions = SGPVisitorOptions(),
@@ -76,11 +206,6 @@ def parse(
         if source_unit is None:
             raise Exception("AST was not generated")
 
-    # TODO: sort it out
-    token_list = []
-    if options.tokens:
-        token_list = build_token_list(token_stream.getTokens(), options)
-
     if not options.errors_tolerant and listener.has_errors():
         raise ParserError(errors=listener.get_errors())
 
@@ -89,162 +214,168 @@ def parse(
 
     # TODO: sort it out
     if options.tokens:
-        source_unit["tokens"] = token_list
+        source_unit.tokens = _LazyTokens(token_stream, options)
 
     if dump_json:
         os.makedirs(dump_path, exist_ok=True)
-        with open(os.path.join(dump_path, "ast.json"), "w") as f:
-            s = simplejson.dumps(
-                source_unit,
-                default=lambda obj: {
-                    string_from_snake_to_camel_case(k): v
-                    for k, v in obj.__dict__.items()
-                },
-            )
-            f.write(s)
+        _dump_ast_json(source_unit, os.path.join(dump_path, "ast.json"))
     return source_unit
 
+def _brace_events(text):
+    """
+    Collect the offsets of every '{' and '}' in text, in ascending order.
+    """
+    events = []
+    for brace in "{}":
+        pos = text.find(brace)
+        while pos != -1:
+            events.append(pos)
+            pos = text.find(brace, pos + 1)
+    events.sort()
+    return events
+
+
+def _header_start(prefix_re, prefix_ends, text, pos, floor=0):
+    """
+    Return where the modifiers in front of the fn/fun keyword at pos begin, or pos if there are none.
+
+    Modifiers never contain ';', '{' or '}', so the look-back starts after the
+    last of those before pos, and never before floor (the end of the previous
+    header match), which keeps the scans over a file linear overall.
+
+    Most keywords have no modifiers at all. A non-empty prefix always ends
+    with one of prefix_ends followed by whitespace, so that plain string check
+    runs first and the regex search is only done when it can match.
+    """
+    start = max(floor, *(text.rfind(stop, floor, pos) + 1 for stop in ";{}"))
+    if not text[start:pos].rstrip().endswith(prefix_ends):
+        return pos
+    return prefix_re.search(text, start, pos).start()
+
+
+def _match_braces(text):
+    """
+    Pair every '{' in text with its closing '}' in a single pass.
+
+    Parameters
+    ----------
+    text : str - The source text.
+
+    Returns
+    -------
+    Dict[int, int] - Maps the offset of each '{' to the offset just past its matching '}'. Braces that are never closed are absent.
+    """
+    body_ends = {}
+    open_braces = []
+    for pos in _brace_events(text):
+        if text[pos] == '{':
+            open_braces.append(pos)
+        elif open_braces:
+            body_ends[open_braces.pop()] = pos + 1
+    return body_ends
+
 def find_rust_functions(text, filename,hash):
-    regex = r"((?:pub(?:\s*\([^)]*\))?\s+)?fn\s+\w+(?:<[^>]*>)?\s*\([^{]*\)(?:\s*->\s*[^{]*)?\s*\{)"
-    matches = re.finditer(regex, text)
+    matches = list(_RUST_FN_RE.finditer(text))
 
     # 函数列表
     functions = []
+    contract_name = filename.replace('.rs','_rust'+str(hash))
 
     # 将文本分割成行，用于更容易地计算行号
     lines = text.split('\n')
-    line_starts = {i: sum(len(line) + 1 for line in lines[:i]) for i in range(len(lines))}
+    line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
 
-    # 先收集所有函数体，构建完整的函数代码
-    function_bodies = []
+    # 先定位所有函数体，构建完整的函数代码
+    body_ends = _match_braces(text)
+    function_spans = []
+    previous_end = 0
     for match in matches:
-        brace_count = 1
-        function_body_start = match.start()
-        inside_braces = True
-
-        for i in range(match.end(), len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-
-            if inside_braces and brace_count == 0:
-                function_body_end = i + 1
-                function_bodies.append(text[function_body_start:function_body_end])
-                break
-
-    # 完整的函数代码字符串
-    contract_code = "\n".join(function_bodies).strip()
-
-    # 再次遍历匹配，创建函数定义
-    for match in re.finditer(regex, text):
-        start_line_number = next(i for i, pos in line_starts.items() if pos > match.start()) - 1
-        brace_count = 1
-        function_body_start = match.start()
-        inside_braces = True
-
-        for i in range(match.end(), len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-
-            if inside_braces and brace_count == 0:
-                function_body_end = i + 1
-                # Modified part starts here
-                end_line_number = next((i for i, pos in line_starts.items() if pos > function_body_end), len(lines)) - 1
-                # Modified part ends here
-                function_body = text[function_body_start:function_body_end]
-                function_body_lines = function_body.count('\n') + 1
-                visibility = 'public' if 'pub' in match.group(1) else 'private'
-                functions.append({
-                    'type': 'FunctionDefinition',
-                    'name': 'special_'+re.search(r'\bfn\s+(\w+)', match.group(1)).group(1),
-                    'start_line': start_line_number + 1,
-                    'end_line': end_line_number,
-                    'offset_start': 0,
-                    'offset_end': 0,
-                    'content': function_body,
-                    'contract_name': filename.replace('.rs','_rust'+str(hash)),
-                    'contract_code': contract_code,
-                    'modifiers': [],
-                    'stateMutability': None,
-                    'returnParameters': None,
-                    'visibility': visibility,
-                    'node_count': function_body_lines
-                })
-                break
+        function_body_end = body_ends.get(match.end() - 1)
+        if function_body_end is not None:
+            function_body_start = _header_start(_RUST_PREFIX_RE, _RUST_PREFIX_ENDS, text, match.start(), previous_end)
+            function_spans.append((function_body_start, match, function_body_end))
+        previous_end = match.end()
+
+    # 完整的函数代码字符串，直接由函数体区间切片拼接
+    contract_code = "\n".join(text[start:end] for start, _, end in function_spans).strip()
+
+    # 根据已定位的函数体创建函数定义
+    for function_body_start, match, function_body_end in function_spans:
+        start_line_number = bisect_right(line_starts, function_body_start) - 1
+        end_line_number = bisect_right(line_starts, function_body_end, start_line_number) - 1
+        function_body = text[function_body_start:function_body_end]
+        function_body_lines = end_line_number - start_line_number + 1
+        visibility = 'public' if 'pub' in text[function_body_start:match.end()] else 'private'
+        functions.append({
+            'type': 'FunctionDefinition',
+            'name': 'special_'+match.group(1),
+            'start_line': start_line_number + 1,
+            'end_line': end_line_number,
+            'offset_start': 0,
+            'offset_end': 0,
+            'content': function_body,
+            'contract_name': contract_name,
+            'contract_code': contract_code,
+            'modifiers': [],
+            'stateMutability': None,
+            'returnParameters': None,
+            'visibility': visibility,
+            'node_count': function_body_lines
+        })
 
     return functions
 def find_move_functions(text, filename, hash):
-    # regex = r"((?:public\s+)?(?:entry\s+)?(?:native\s+)?(?:inline\s+)?fun\s+(?:<[^>]+>\s*)?(\w+)\s*(?:<[^>]+>)?\s*\([^)]*\)(?:\s*:\s*[^{]+)?(?:\s+acquires\s+[^{]+)?\s*\{)"
-    regex = r"((?:public\s+)?(?:entry\s+)?(?:native\s+)?(?:inline\s+)?fun\s+(?:<[^>]+>\s*)?(\w+)\s*(?:<[^>]+>)?\s*\([^)]*\)(?:\s*:\s*[^{]+)?(?:\s+acquires\s+[^{]+)?\s*(?:\{|;))"
-    matches = re.finditer(regex, text)
+    matches = list(_MOVE_FN_RE.finditer(text))
 
     functions = []
+    contract_name = filename.replace('.move', '_move' + str(hash))
     lines = text.split('\n')
-    line_starts = {i: sum(len(line) + 1 for line in lines[:i]) for i in range(len(lines))}
+    line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
 
-    function_bodies = []
+    body_ends = _match_braces(text)
+    function_spans = []
+    previous_end = 0
     for match in matches:
-        if match.group(1).strip().endswith(';'):  # native function
-            function_bodies.append(match.group(1))
+        function_body_start = _header_start(_MOVE_PREFIX_RE, _MOVE_PREFIX_ENDS, text, match.start(), previous_end)
+        previous_end = match.end()
+        if match.group(0).endswith(';'):  # native function
+            function_spans.append((function_body_start, match, None))
         else:
-            brace_count = 1
-            function_body_start = match.start()
-            inside_braces = True
-
-            for i in range(match.end(), len(text)):
-                if text[i] == '{':
-                    brace_count += 1
-                elif text[i] == '}':
-                    brace_count -= 1
-
-                if inside_braces and brace_count == 0:
-                    function_body_end = i + 1
-                    function_bodies.append(text[function_body_start:function_body_end])
-                    break
-
-    contract_code = "\n".join(function_bodies).strip()
-
-    for match in re.finditer(regex, text):
-        start_line_number = next(i for i, pos in line_starts.items() if pos > match.start()) - 1
+            function_body_end = body_ends.get(match.end() - 1)
+            if function_body_end is not None:
+                function_spans.append((function_body_start, match, function_body_end))
+
+    contract_code = "\n".join(
+        text[start:match.end() if end is None else end]
+        for start, match, end in function_spans
+    ).strip()
+
+    for function_body_start, match, function_body_end in function_spans:
+        start_line_number = bisect_right(line_starts, function_body_start) - 1
+        header = text[function_body_start:match.end()]
         
-        if match.group(1).strip().endswith(';'):  # native function
-            function_body = match.group(1)
+        if function_body_end is None:  # native function
+            function_body = header
             end_line_number = start_line_number
             function_body_lines = 1
         else:
-            brace_count = 1
-            function_body_start = match.start()
-            inside_braces = True
-
-            for i in range(match.end(), len(text)):
-                if text[i] == '{':
-                    brace_count += 1
-                elif text[i] == '}':
-                    brace_count -= 1
-
-                if inside_braces and brace_count == 0:
-                    function_body_end = i + 1
-                    end_line_number = next(i for i, pos in line_starts.items() if pos > function_body_end) - 1
-                    function_body = text[function_body_start:function_body_end]
-                    function_body_lines = function_body.count('\n') + 1
-                    break
+            end_line_number = bisect_right(line_starts, function_body_end, start_line_number) - 1
+            function_body = text[function_body_start:function_body_end]
+            function_body_lines = end_line_number - start_line_number + 1
 
-        visibility = 'public' if 'public' in match.group(1) else 'private'
-        is_native = 'native' in match.group(1)
+        visibility = 'public' if 'public' in header else 'private'
+        is_native = 'native' in header
         
         functions.append({
             'type': 'FunctionDefinition',
-            'name':  'special_' + match.group(2),
+            'name':  'special_' + match.group(1),
             'start_line': start_line_number + 1,
             'end_line': end_line_number,
             'offset_start': 0,
             'offset_end': 0,
             'content': function_body,
-            'header': match.group(1).strip(),  # 新增：函数头部
-            'contract_name': filename.replace('.move', '_move' + str(hash)),
+            'header': header.strip(),  # 新增：函数头部
+            'contract_name': contract_name,
             'contract_code': contract_code,
             'modifiers': ['native'] if is_native else [],
             'stateMutability': None,
@@ -254,34 +385,27 @@ def find_move_functions(text, filename, hash):
         })
 
     return functions
-import re
 def find_go_functions(text, filename, hash):
-    regex = r"func\s+.*\{"
-    matches = re.finditer(regex, text)
+    matches = _GO_FUNC_RE.finditer(text)
 
     functions = []
+    contract_name = filename.replace('.go', '_go' + str(hash))
     lines = text.split('\n')
-    line_starts = {i: sum(len(line) + 1 for line in lines[:i]) for i in range(len(lines))}
+    line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
 
+    body_ends = _match_braces(text)
     for match in matches:
         function_body_start = match.start()
-        start_line_number = next(i for i, pos in line_starts.items() if pos > function_body_start) - 1
+        start_line_number = bisect_right(line_starts, function_body_start) - 1
         
         # Find the end of the function body
-        brace_count = 1
-        function_body_end = function_body_start
-        for i in range(match.end(), len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    function_body_end = i + 1
-                    break
+        function_body_end = body_ends.get(match.end() - 1)
+        if function_body_end is None:
+            function_body_end = function_body_start
 
-        end_line_number = next(i for i, pos in line_starts.items() if pos > function_body_end) - 1
+        end_line_number = bisect_right(line_starts, function_body_end, start_line_number) - 1
         function_body = text[function_body_start:function_body_end]
-        function_body_lines = function_body.count('\n') + 1
+        function_body_lines = end_line_number - start_line_number + 1
 
         functions.append({
             'type': 'FunctionDefinition',
@@ -291,7 +415,7 @@ def find_go_functions(text, filename, hash):
             'offset_start': 0,
             'offset_end': 0,
             'content': function_body,
-            'contract_name': filename.replace('.go', '_go' + str(hash)),
+            'contract_name': contract_name,
             'contract_code': text,
             'modifiers': [],
             'stateMutability': None,
@@ -302,21 +426,21 @@ def find_go_functions(text, filename, hash):
 
     return functions
 def find_python_functions(text, filename, hash_value):
-    # 更新后的正则表达式，使返回类型部分可选
-    regex = r"def\s+(\w+)\s*\((.*?)\)(?:\s*->\s*(\w+))?\s*:"
-    matches = re.finditer(regex, text)
+    matches = _PYTHON_DEF_RE.finditer(text)
 
     # 函数列表
     functions = []
+    contract_name = filename.replace('.py', '_python' + str(hash_value))
+    contract_code = text.strip()  # 整个代码
 
     # 将文本分割成行，用于更容易地计算行号
     lines = text.split('\n')
-    line_starts = {i: sum(len(line) + 1 for line in lines[:i]) for i in range(len(lines))}
+    line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
 
     # 遍历匹配，创建函数定义
     if any(matches):  # 如果有匹配的函数定义
         for match in matches:
-            start_line_number = next(i for i, pos in line_starts.items() if pos > match.start()) - 1
+            start_line_number = bisect_right(line_starts, match.start()) - 1
             indent_level = len(lines[start_line_number]) - len(lines[start_line_number].lstrip())
 
             # 查找函数体的结束
@@ -328,9 +452,9 @@ def find_python_functions(text, filename, hash_value):
                 end_line_number += 1
             end_line_number -= 1  # Adjust to include last valid line of the function
 
-            # 构建函数体
-            function_body = '\n'.join(lines[start_line_number:end_line_number+1])
-            function_body_lines = function_body.count('\n') + 1
+            # 构建函数体，直接按行偏移切片，行数由行号推出
+            function_body = text[line_starts[start_line_number]:line_starts[end_line_number + 1] - 1]
+            function_body_lines = end_line_number - start_line_number + 1
 
             functions.append({
                 'type': 'FunctionDefinition',
@@ -340,8 +464,8 @@ def find_python_functions(text, filename, hash_value):
                 'offset_start': 0,
                 'offset_end': 0,
                 'content': function_body,
-                'contract_name': filename.replace('.py', '_python' + str(hash_value)),
-                'contract_code': text.strip(),  # 整个代码
+                'contract_name': contract_name,
+                'contract_code': contract_code,
                 'modifiers': [],
                 'stateMutability': None,
                 'returnParameters': None,
@@ -357,9 +481,9 @@ def find_python_functions(text, filename, hash_value):
             'end_line': function_body_lines,
             'offset_start': 0,
             'offset_end': 0,
-            'content': text.strip(),
-            'contract_name': filename.replace('.py', '_python' + str(hash_value)),
-            'contract_code': text.strip(),
+            'content': contract_code,
+            'contract_name': contract_name,
+            'contract_code': contract_code,
             'modifiers': [],
             'stateMutability': None,
             'returnParameters': None,
@@ -369,93 +493,70 @@ def find_python_functions(text, filename, hash_value):
 
     return functions
 def find_cairo_functions(text, filename,hash):
-    regex = r"((?:pub(?:\s*\([^)]*\))?\s+)?fn\s+\w+(?:<[^>]*>)?\s*\([^{]*\)(?:\s*->\s*[^{]*)?\s*\{)"
-    matches = re.finditer(regex, text)
+    matches = list(_CAIRO_FN_RE.finditer(text))
 
     # 函数列表
     functions = []
+    contract_name = filename.replace('.cairo','_cairo'+str(hash))
 
     # 将文本分割成行，用于更容易地计算行号
     lines = text.split('\n')
-    line_starts = {i: sum(len(line) + 1 for line in lines[:i]) for i in range(len(lines))}
+    line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
 
-    # 先收集所有函数体，构建完整的函数代码
-    function_bodies = []
+    # 先定位所有函数体；Cairo 不输出 contract_code，无需拼接
+    body_ends = _match_braces(text)
+    function_spans = []
+    previous_end = 0
     for match in matches:
-        brace_count = 1
-        function_body_start = match.start()
-        inside_braces = True
-
-        for i in range(match.end(), len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-
-            if inside_braces and brace_count == 0:
-                function_body_end = i + 1
-                function_bodies.append(text[function_body_start:function_body_end])
-                break
-
-    # 完整的函数代码字符串
-    contract_code = "\n".join(function_bodies).strip()
-
-    # 再次遍历匹配，创建函数定义
-    for match in re.finditer(regex, text):
-        start_line_number = next(i for i, pos in line_starts.items() if pos > match.start()) - 1
-        brace_count = 1
-        function_body_start = match.start()
-        inside_braces = True
-
-        for i in range(match.end(), len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-
-            if inside_braces and brace_count == 0:
-                function_body_end = i + 1
-                end_line_number = next(i for i, pos in line_starts.items() if pos > function_body_end) - 1
-                function_body = text[function_body_start:function_body_end]
-                function_body_lines = function_body.count('\n') + 1
-                visibility = 'public'
-                functions.append({
-                    'type': 'FunctionDefinition',
-                    'name': 'special_'+re.search(r'\bfn\s+(\w+)', match.group(1)).group(1),  # Extract function name from match
-                    'start_line': start_line_number + 1,
-                    'end_line': end_line_number,
-                    'offset_start': 0,
-                    'offset_end': 0,
-                    'content': function_body,
-                    'contract_name': filename.replace('.cairo','_cairo'+str(hash)),
-                    'contract_code': "",
-                    'modifiers': [],
-                    'stateMutability': None,
-                    'returnParameters': None,
-                    'visibility': visibility,
-                    'node_count': function_body_lines
-                })
-                break
+        function_body_end = body_ends.get(match.end() - 1)
+        if function_body_end is not None:
+            function_body_start = _header_start(_CAIRO_PREFIX_RE, _CAIRO_PREFIX_ENDS, text, match.start(), previous_end)
+            function_spans.append((function_body_start, match, function_body_end))
+        previous_end = match.end()
+
+    # 根据已定位的函数体创建函数定义
+    for function_body_start, match, function_body_end in function_spans:
+        start_line_number = bisect_right(line_starts, function_body_start) - 1
+        end_line_number = bisect_right(line_starts, function_body_end, start_line_number) - 1
+        function_body = text[function_body_start:function_body_end]
+        function_body_lines = end_line_number - start_line_number + 1
+        visibility = 'public'
+        functions.append({
+            'type': 'FunctionDefinition',
+            'name': 'special_'+match.group(1),  # Extract function name from match
+            'start_line': start_line_number + 1,
+            'end_line': end_line_number,
+            'offset_start': 0,
+            'offset_end': 0,
+            'content': function_body,
+            'contract_name': contract_name,
+            'contract_code': "",
+            'modifiers': [],
+            'stateMutability': None,
+            'returnParameters': None,
+            'visibility': visibility,
+            'node_count': function_body_lines
+        })
 
     return functions
 
-def get_antlr_parsing(path):
-    with open(path, 'r', encoding='utf-8', errors="ignore") as file:
-        code = file.read()
-        hash_value=hash(code)
+# Regex-based helpers by file extension; anything else is parsed as Solidity
+_FUNCTION_FINDERS = {
+    ".rs": find_rust_functions,
+    ".py": find_python_functions,
+    ".move": find_move_functions,
+    ".cairo": find_cairo_functions,
+}
+
+
+def _parse_code(path, code, hash_value):
+    """
+    Extract contract and function entries from code, picking the parser by path.
+    """
     filename = os.path.basename(path)
-    if ".rs" in str(path):
-        rust_functions = find_rust_functions(code, filename,hash_value)
-        return rust_functions
-    if ".py" in str(path):
-        python_functions = find_python_functions(code, filename,hash_value)
-        return python_functions
-    if ".move" in str(path):
-        move_functions = find_move_functions(code, filename,hash_value)
-        return move_functions
-    if ".cairo" in str(path):
-        cairo_functions = find_cairo_functions(code, filename,hash_value)
-        return cairo_functions
+    find_functions = _FUNCTION_FINDERS.get(os.path.splitext(filename)[1])
+    if find_functions is not None:
+        return find_functions(code, filename, hash_value)
     else:
         input_stream = ANTLRInputStream(code)
         lexer = SolidityLexer(input_stream)
@@ -469,9 +570,132 @@ def get_antlr_parsing(path):
         return visitor.results
 
 
+def _read_source(path):
+    """
+    Read a source file, returning its text and a hash of its raw bytes.
+
+    The file is read as bytes and decoded once; newlines are normalised the
+    same way text-mode open() would.
+    """
+    with open(path, 'rb') as file:
+        raw = file.read()
+    code = raw.decode('utf-8', errors="ignore")
+    if '\r' in code:
+        code = code.replace('\r\n', '\n').replace('\r', '\n')
+    return code, hash(raw)
+
+
+def _remember(key, results):
+    """
+    Store results in _parse_cache, evicting the least recently used entry when full.
+    """
+    _parse_cache[key] = results
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+
+
+def _cached(key):
+    """
+    Return the cached results for key, or None, marking them as recently used.
+    """
+    results = _parse_cache.get(key)
+    if results is not None:
+        _parse_cache.move_to_end(key)
+    return results
+
+
+def get_antlr_parsing(path):
+    code, hash_value = _read_source(path)
+
+    key = (str(path), hash_value)
+    results = _cached(key)
+    if results is None:
+        results = _parse_code(path, code, hash_value)
+        _remember(key, results)
+
+    # callers annotate and rename the returned entries in place
+    return [dict(result) for result in results]
+
+
+_WARMUP_SOURCE = """
+pragma solidity ^0.8.0;
+
+contract Warmup {
+    function f(uint a) public pure returns (uint) {
+        return a + 1;
+    }
+}
+"""
+
+
+def _warm_antlr():
+    """
+    Worker initializer: parse a tiny contract so the Solidity lexer/parser DFA is populated.
+    """
+    _parse_code("Warmup.sol", _WARMUP_SOURCE, 0)
+
+
+def parse_paths(paths, max_workers=None):
+    """
+    Run get_antlr_parsing over many files in a pool of worker processes.
+
+    Files whose contents are already in _parse_cache are not sent to the
+    pool, and the results parsed by the workers are added to it.
+
+    On Linux the workers are forked from an already warmed-up parent, so they
+    share its deserialized ATN and DFA copy-on-write. Elsewhere they use the
+    platform's default start method and warm up once each on startup.
+
+    Parameters
+    ----------
+    paths : List[str] - The files to parse.
+    max_workers : int - The number of worker processes; defaults to the CPU count.
+
+    Returns
+    -------
+    Dict[str, List[Dict]] - The get_antlr_parsing result for each path, in input order.
+    """
+    paths = list(paths)
+
+    # files already in _parse_cache are served from it; only the rest go to the pool
+    parsed = {}
+    pending = []
+    for path in dict.fromkeys(paths):
+        code, hash_value = _read_source(path)
+        key = (str(path), hash_value)
+        results = _cached(key)
+        if results is None:
+            pending.append((path, key, code, hash_value))
+        else:
+            parsed[path] = results
+    if not pending:
+        pending_paths = keys = codes = hash_values = ()
+    else:
+        pending_paths, keys, codes, hash_values = zip(*pending)
+
+    if len(pending) < 2:
+        fresh = map(_parse_code, pending_paths, codes, hash_values)
+    else:
+        if sys.platform.startswith("linux"):
+            # forked workers inherit the warm parent, no per-worker warm-up needed
+            _warm_antlr()
+            pool_args = {"mp_context": mp.get_context("fork")}
+        else:
+            # fork is unsafe on macOS; spawned workers start cold and warm themselves up
+            pool_args = {"initializer": _warm_antlr}
+
+        with ProcessPoolExecutor(max_workers=max_workers, **pool_args) as executor:
+            fresh = list(executor.map(_parse_code, pending_paths, codes, hash_values))
+
+    for path, key, results in zip(pending_paths, keys, fresh):
+        _remember(key, results)
+        parsed[path] = results
+
+    # callers annotate and rename the returned entries in place
+    return {path: [dict(result) for result in parsed[path]] for path in paths}
+
 
 def get_antlr_ast(path):
-    with open(path, 'r', encoding='utf-8', errors="ignore") as file:
-        code = file.read()
+    code, _ = _read_source(path)
 
     parse(code,dump_json=True,dump_path="./")
\ No newline at end of file
@@ -1,5 +1,12 @@
+import os
+from functools import lru_cache
 from typing import List, Dict, Any
 
+from antlr4.Token import Token
+
+# token name/literal to type listing generated alongside the parser
+TOKENS_FILE = os.path.join(os.path.dirname(__file__), "parser", "Solidity.tokens")
+
 def rsplit(input_string: str, value: str) -> List[str]:
     index = input_string.rfind(value)
     return [input_string[:index], input_string[index + 1:]]
@@ -52,27 +59,42 @@ def get_token_type_map(tokens: str) -> Dict[int, str]:
     token_map = {}
 
     for line in lines:
+        if not line:
+            continue
         value, key = rsplit(line, '=')
         token_map[int(key)] = normalize_token_type(value)
 
     return token_map
 
+@lru_cache(maxsize=None)
+def load_token_type_map() -> Dict[int, str]:
+    with open(TOKENS_FILE) as f:
+        return get_token_type_map(f.read())
+
 #TODO: sort it out
-def build_token_list(tokens_arg: List[Dict[str, Any]], options: Dict[str, Any]) -> List[Dict[str, Any]]:
-    token_types = get_token_type_map(tokens_arg)
+def build_token_list(tokens_arg: List[Token], options) -> List[Dict[str, Any]]:
+    """
+    Convert lexer tokens into plain dicts of type and value.
+
+    Parameters
+    ----------
+    tokens_arg : List[Token] - The tokens from the token stream, without EOF.
+    options : SGPVisitorOptions - `range` and `loc` add offset and line/column information.
+    """
+    token_types = load_token_type_map()
     result = []
 
     for token in tokens_arg:
-        type_str = get_token_type(token_types[token['type']])
-        node = {'type': type_str, 'value': token['text']}
+        type_str = get_token_type(token_types[token.type])
+        node = {'type': type_str, 'value': token.text}
 
-        if options.get('range', False):
-            node['range'] = [token['startIndex'], token['stopIndex'] + 1]
+        if options.range:
+            node['range'] = [token.start, token.stop + 1]
 
-        if options.get('loc', False):
+        if options.loc:
             node['loc'] = {
-                'start': {'line': token['line'], 'column': token['charPositionInLine']},
-                'end': {'line': token['line'], 'column': token['charPositionInLine'] + len(token['text']) if token['text'] else 0}
+                'start': {'line': token.line, 'column': token.column},
+                'end': {'line': token.line, 'column': token.column + len(token.text) if token.text else 0}
             }
 
         result.append(node)
@@ -1,5 +1,5 @@
 
-from library.sgp.sgp_parser import get_antlr_parsing
+from library.sgp.sgp_parser import parse_paths
 from library.parsing.callgraph import CallGraph
 import os
 import re
@@ -158,21 +158,32 @@ def parse_project(project_path, project_filter = None):
     if os.getenv('IGNORE_FOLDERS'):
         ignore_folders = set(os.getenv('IGNORE_FOLDERS').split(','))
     ignore_folders.add('.git')
-    all_results = []
+    walked_files = []
+    files_to_scan = []
     for dirpath, dirs, files in os.walk(project_path):
         dirs[:] = [d for d in dirs if d not in ignore_folders]
         for file in files:
             to_scan = not project_filter.filter_file(dirpath, file)
             sol_file = os.path.join(dirpath, file) # relative path
-            absolute_path = os.path.abspath(sol_file)  # absolute path
-            print("parsing file: ", sol_file, " " if to_scan else "[skipped]")
+            walked_files.append((sol_file, to_scan))
             
             if to_scan:
-                results = get_antlr_parsing(sol_file)
-                for result in results:
-                    result['relative_file_path'] = sol_file
-                    result['absolute_file_path'] = absolute_path
-                all_results.extend(results)
+                files_to_scan.append(sol_file)
+
+    # 多进程并行解析所有文件
+    parsed_files = parse_paths(files_to_scan)
+    all_results = []
+    for sol_file, to_scan in walked_files:
+        print("parsing file: ", sol_file, " " if to_scan else "[skipped]")
+        if not to_scan:
+            continue
+
+        results = parsed_files[sol_file]
+        absolute_path = os.path.abspath(sol_file)  # absolute path
+        for result in results:
+            result['relative_file_path'] = sol_file
+            result['absolute_file_path'] = absolute_path
+        all_results.extend(results)
     
     functions = [result for result in all_results if result['type'] == 'FunctionDefinition']
     # fix func name 